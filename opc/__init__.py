@@ -3,13 +3,15 @@ from .decorators import requires_firmware
 from .lookup_table import OPC_LOOKUP
 
 from time import sleep
+try:
+    from time import monotonic
+except ImportError: # Python 2
+    from time import time as monotonic
+from bisect import bisect_left
 import struct
-import warnings
 import re
 import logging
 
-from .exceptions import firmware_error_msg
-
 # set up a default logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,6 +20,37 @@ __version__ = "1.6.0"
 
 __all__ = ['OPCN2', 'OPCN1']
 
+# Firmware version as reported in the info string (e.g. 'OPC-018.2' -> '018')
+_FIRMWARE_RE = re.compile(r"\d{3}")
+
+# Dictionary keys shared by every histogram and config read
+_BIN_KEYS           = tuple('Bin {0}'.format(i) for i in range(16))
+_MTOF_KEYS          = ('Bin1 MToF', 'Bin3 MToF', 'Bin5 MToF', 'Bin7 MToF')
+_BIN_BOUNDARY_KEYS  = tuple('Bin Boundary {0}'.format(i) for i in range(15))
+_BPV_KEYS           = tuple('BPV {0}'.format(i) for i in range(16))
+_BPD_KEYS           = tuple('BPD {0}'.format(i) for i in range(16))
+_BSVW_KEYS          = tuple('BSVW {0}'.format(i) for i in range(16))
+
+# Precompiled struct formats for decoding little-endian OPC responses
+_FLOAT          = struct.Struct('<f')     # IEEE 754 single precision float
+_UINT16         = struct.Struct('<H')     # unsigned 16-bit int
+_UINT32         = struct.Struct('<I')     # unsigned 32-bit int
+_HISTOGRAM_BINS = struct.Struct('<16H')   # 16 unsigned 16-bit bin counts
+_HISTOGRAM_TAIL = struct.Struct('<H3f')   # Checksum, PM1, PM2.5, PM10
+
+# Blocks of the 256 byte OPC-N2 configuration variables
+_CONFIG_BIN_BOUNDARIES  = struct.Struct('<15H')    # bin boundary ADC values
+_CONFIG_BIN_FLOATS      = struct.Struct('<16f')    # one value per bin (BPV, BPD, BSVW)
+
+# OPC-N1 bin boundary ADC values
+_N1_BIN_BOUNDARIES      = struct.Struct('<14H')
+
+# Complete 62 byte OPC-N2 histogram frames: bins, MToF, three 4-byte fields
+# (temperature/pressure/period or SFR/temperature-or-pressure/period),
+# checksum and PM values
+_HISTOGRAM_FRAME_V14 = struct.Struct('<16H4B3IH3f')   # firmware < v16
+_HISTOGRAM_FRAME_V16 = struct.Struct('<16H4BfIfH3f')  # firmware >= v16
+
 class _OPC(object):
     """Generic class for any Alphasense OPC. Provides the common methods and calculations for each OPC. This class is designed to be the base class, and should not be used alone unless during development.
 
@@ -44,6 +77,9 @@ class _OPC(object):
         self.debug      = kwargs.get('debug', False)
         self.model      = kwargs.get('model', 'N2')
 
+        # Earliest time at which the OPC will accept the next command
+        self._ready_at  = 0.
+
         if firmware is not None:
             major, minor = firmware[0], firmware[1]
             version = float("{}.{}".format(major, minor))
@@ -74,9 +110,9 @@ class _OPC(object):
                 infostring = self.read_info_string()
 
                 try:
-                    self.firmware['version'] = int(re.findall("\d{3}", infostring)[-1])
+                    self.firmware['version'] = int(_FIRMWARE_RE.findall(infostring)[-1])
                 except Exception as e:
-                    logger.error("Could not parse the fimrware version from {}".format(infostring), exc_info=True)
+                    logger.error("Could not parse the firmware version from %r", infostring, exc_info=True)
 
                     # sleep for a period of time
                     sleep(retry_interval_ms / 1000)
@@ -101,32 +137,85 @@ class _OPC(object):
         else: # Sleep for a bit to alleviate issues
             sleep(1)
 
-    def _16bit_unsigned(self, LSB, MSB):
-        """Returns the combined LSB and MSB
+    def _wait_for_ready(self):
+        """Sleep until the OPC is ready to accept the next command. Only sleeps
+        if the previous command finished less than its hold-off interval ago.
+        """
+        delay = self._ready_at - monotonic()
+
+        if delay > 0:
+            sleep(delay)
+
+    def _defer_next_command(self, interval=0.1):
+        """Mark the end of a command. Instead of sleeping right away, the next
+        command waits until interval seconds have passed since now.
+
+        :param interval: Minimum gap before the next command. Units are in seconds.
+
+        :type interval: float
+        """
+        self._ready_at = monotonic() + interval
+
+    def _read_n(self, command, n, settle=10e-3):
+        """Send a command byte and read back its n byte response. Waits for the
+        OPC to be ready first and starts the hold-off for the next command once
+        the response has been read.
+
+        :param command: The command byte
+        :param n: Number of bytes in the response
+        :param settle: Time to wait between the command byte and the response. Units are in seconds.
+
+        :type command: int
+        :type n: int
+        :type settle: float
+
+        :rtype: bytearray
+        """
+        self._wait_for_ready()
+
+        # Send the command byte and wait for the OPC to prepare the response.
+        # This has to be a transfer of its own: spidev's delay_usecs is only
+        # applied after a whole transfer and usbiss has no delay option at all
+        self.cnxn.xfer([command])
+        sleep(settle)
+
+        # Read the response by sending n empty bytes in a single transfer. The
+        # padding is built fresh every time: spidev writes the received bytes
+        # back into the list it is given, so a reused list would send stale data
+        resp = bytearray(self.cnxn.xfer([0x00] * n))
 
-        :param LSB: Least Significant Byte
-        :param MSB: Most Significant Byte
+        self._defer_next_command()
 
-        :type LSB: byte
-        :type MSB: byte
+        return resp
+
+    def _16bit_unsigned(self, buf, offset=0):
+        """Returns the little-endian 16-bit unsigned int starting at offset
+
+        :param buf: Response bytes
+        :param offset: Index of the Least Significant Byte
+
+        :type buf: bytearray
+        :type offset: int
 
         :rtype: 16-bit unsigned int
         """
-        return (MSB << 8) | LSB
+        return _UINT16.unpack_from(buf, offset)[0]
 
-    def _calculate_float(self, byte_array):
-        """Returns an IEEE 754 float from an array of 4 bytes
+    def _calculate_float(self, buf, offset=0):
+        """Returns an IEEE 754 float from the 4 bytes starting at offset
 
-        :param byte_array: Expects an array of 4 bytes
+        :param buf: Response bytes
+        :param offset: Index of the first of the 4 bytes
 
-        :type byte_array: array
+        :type buf: bytearray
+        :type offset: int
 
         :rtype: float
         """
-        if len(byte_array) != 4:
+        if len(buf) < offset + 4:
             return None
 
-        return struct.unpack('f', struct.pack('4B', *byte_array))[0]
+        return _FLOAT.unpack_from(buf, offset)[0]
 
     def _calculate_mtof(self, mtof):
         """Returns the average amount of time that particles in a bin
@@ -140,46 +229,81 @@ class _OPC(object):
         """
         return mtof / 3.0
 
-    def _calculate_temp(self, vals):
+    def _scale_temp(self, raw):
+        """Converts a raw temperature reading to degrees celcius
+
+        :param raw: Raw temperature value (tenths of a degree)
+
+        :type raw: int
+
+        :rtype: float
+        """
+        return raw / 10.0
+
+    def _scale_period(self, raw):
+        """Converts a raw pre-v16 sampling period to seconds
+
+        :param raw: Raw sampling period (ticks of the 12 MHz clock)
+
+        :type raw: int
+
+        :rtype: float
+        """
+        return raw / 12e6
+
+    def _calculate_temp(self, buf, offset=0):
         """Calculates the temperature in degrees celcius
 
-        :param vals: array of bytes
+        :param buf: Response bytes
+        :param offset: Index of the first of the 4 bytes
 
-        :type vals: array
+        :type buf: bytearray
+        :type offset: int
 
         :rtype: float
         """
-        if len(vals) < 4:
+        if len(buf) < offset + 4:
             return None
 
-        return ((vals[3] << 24) | (vals[2] << 16) | (vals[1] << 8) | vals[0]) / 10.0
+        return self._scale_temp(_UINT32.unpack_from(buf, offset)[0])
 
-    def _calculate_pressure(self, vals):
+    def _calculate_pressure(self, buf, offset=0):
         """Calculates the pressure in pascals
 
-        :param vals: array of bytes
+        :param buf: Response bytes
+        :param offset: Index of the first of the 4 bytes
 
-        :type vals: array
+        :type buf: bytearray
+        :type offset: int
 
         :rtype: float
         """
-        if len(vals) < 4:
+        if len(buf) < offset + 4:
             return None
 
-        return ((vals[3] << 24) | (vals[2] << 16) | (vals[1] << 8) | vals[0])
+        return _UINT32.unpack_from(buf, offset)[0]
 
-    def _calculate_period(self, vals):
+    def _calculate_period(self, buf, offset=0):
         ''' calculate the sampling period in seconds '''
-        if len(vals) < 4:
+        if len(buf) < offset + 4:
             return None
 
-        if self.firmware['major'] < 16:
-            return ((vals[3] << 24) | (vals[2] << 16) | (vals[1] << 8) | vals[0]) / 12e6
+        if self.firmware['version'] < 16:
+            return self._scale_period(_UINT32.unpack_from(buf, offset)[0])
         else:
-            return self._calculate_float(vals)
+            return self._calculate_float(buf, offset)
 
     def wait(self, **kwargs):
         """Wait for the OPC to prepare itself for data transmission. On some devides this can take a few seconds
+
+        :param check: The interval between attempts to read a histogram. Units are in ms.
+        :param max_tries: Maximum number of histogram reads before giving up.
+
+        :type check: int
+        :type max_tries: int
+
+        :raises: UserWarning
+
         :rtype: self
         :Example:
         >> alpha = opc.OPCN2(spi, debug=True).wait(check=200)
@@ -193,15 +317,16 @@ class _OPC(object):
             raise UserWarning('Your device does not support the self.histogram function, try without wait')
 
         self.on()
-        while True:
-            try:
-                if self.histogram() is None:
-                    raise UserWarning('Could not load histogram, perhaps the device is not yet connected')
 
-            except UserWarning as e:
-                sleep(kwargs.get('check', 200) / 1000.)
+        interval = kwargs.get('check', 200) / 1000.
+
+        for i in range(kwargs.get('max_tries', 20)):
+            if self.histogram() is not None:
+                return self
 
-        return self
+            sleep(interval)
+
+        raise UserWarning('Could not load histogram, perhaps the device is not yet connected')
 
     def lookup_bin_boundary(self, adc_value):
         """Looks up the bin boundary value in microns based on the lookup table provided by Alphasense.
@@ -229,8 +354,14 @@ class _OPC(object):
 
             :rtype: int
         """
+        # OPC_LOOKUP is sorted, so bisect for the first entry >= bb and compare
+        # it with its lower neighbour; ties resolve to the lowest ADC value
+        i = bisect_left(OPC_LOOKUP, bb)
+
+        if i == len(OPC_LOOKUP) or (i > 0 and bb - OPC_LOOKUP[i - 1] <= OPC_LOOKUP[i] - bb):
+            i = bisect_left(OPC_LOOKUP, OPC_LOOKUP[i - 1])
 
-        return min(enumerate(OPC_LOOKUP), key = lambda x: abs(x[1] - bb))[0]
+        return i
 
     def read_info_string(self):
         """Reads the information string for the OPC
@@ -242,31 +373,23 @@ class _OPC(object):
         >>> alpha.read_info_string()
         'OPC-N2 FirmwareVer=OPC-018.2....................BD'
         """
-        infostring = []
+        # Send the command byte and read the 60 byte info string
+        resp = self._read_n(0x3F, 60, settle=9e-3)
 
-        # Send the command byte and sleep for 9 ms
-        self.cnxn.xfer([0x3F])
-        sleep(9e-3)
-
-        # Read the info string by sending 60 empty bytes
-        for i in range(60):
-            resp = self.cnxn.xfer([0x00])[0]
-            infostring.append(chr(resp))
-
-        sleep(0.1)
-
-        return ''.join(infostring)
+        return resp.decode('latin-1')
 
     def ping(self):
         """Checks the connection between the Raspberry Pi and the OPC
 
         :rtype: Boolean
         """
+        self._wait_for_ready()
+
         b = self.cnxn.xfer([0xCF])[0]           # send the command byte
 
-        sleep(0.1)
+        self._defer_next_command()
 
-        return True if b == 0xF3 else False
+        return b == 0xF3
 
     def __repr__(self):
         return "Alphasense OPC-{}v{}".format(self.model, self.firmware['version'])
@@ -300,6 +423,29 @@ class OPCN2(_OPC):
 
             raise FirmwareVersionError("Your firmware is not yet supported. Only versions 14-18 are currently supported.")
 
+    def _power_state_command(self, *option_bytes):
+        """Send the power state command byte (0x03) followed by the option byte(s)
+        that select which peripheral to switch.
+
+        :param option_bytes: The byte(s) sent after the command byte
+
+        :type option_bytes: int
+
+        :rtype: boolean
+        """
+        self._wait_for_ready()
+
+        # Send the command byte and wait 10 ms
+        a = self.cnxn.xfer([0x03])[0]
+        sleep(10e-3)
+
+        # Send the option byte(s)
+        b = self.cnxn.xfer(list(option_bytes))[0]
+
+        self._defer_next_command()
+
+        return a == 0xF3 and b == 0x03
+
     def on(self):
         """Turn ON the OPC (fan and laser)
 
@@ -310,12 +456,7 @@ class OPCN2(_OPC):
         >>> alpha.on()
         True
         """
-        b1 = self.cnxn.xfer([0x03])[0]          # send the command byte
-        sleep(9e-3)                             # sleep for 9 ms
-        b2, b3 = self.cnxn.xfer([0x00, 0x01])   # send the following byte
-        sleep(0.1)
-
-        return True if b1 == 0xF3 and b2 == 0x03 else False
+        return self._power_state_command(0x00, 0x01)
 
     def off(self):
         """Turn OFF the OPC (fan and laser)
@@ -327,12 +468,7 @@ class OPCN2(_OPC):
         >>> alpha.off()
         True
         """
-        b1 = self.cnxn.xfer([0x03])[0]          # send the command byte
-        sleep(9e-3)                             # sleep for 9 ms
-        b2 = self.cnxn.xfer([0x01])[0]          # send the following two bytes
-        sleep(0.1)
-
-        return True if b1 == 0xF3 and b2 == 0x03 else False
+        return self._power_state_command(0x01)
 
     def config(self):
         """Read the configuration variables and returns them as a dictionary
@@ -353,37 +489,26 @@ class OPCN2(_OPC):
             ...
         }
         """
-        config  = []
         data    = {}
 
-        # Send the command byte and sleep for 10 ms
-        self.cnxn.xfer([0x3C])
-        sleep(10e-3)
-
-        # Read the config variables by sending 256 empty bytes
-        for i in range(256):
-            resp = self.cnxn.xfer([0x00])[0]
-            config.append(resp)
+        # Send the command byte and read the 256 config bytes
+        config = self._read_n(0x3C, 256)
 
         # Add the bin bounds to the dictionary of data [bytes 0-29]
-        for i in range(0, 15):
-            data["Bin Boundary {0}".format(i)] = self._16bit_unsigned(config[2*i], config[2*i + 1])
+        data.update(zip(_BIN_BOUNDARY_KEYS, _CONFIG_BIN_BOUNDARIES.unpack_from(config, 0)))
 
         # Add the Bin Particle Volumes (BPV) [bytes 32-95]
-        for i in range(0, 16):
-            data["BPV {0}".format(i)] = self._calculate_float(config[4*i + 32:4*i + 36])
+        data.update(zip(_BPV_KEYS, _CONFIG_BIN_FLOATS.unpack_from(config, 32)))
 
         # Add the Bin Particle Densities (BPD) [bytes 96-159]
-        for i in range(0, 16):
-            data["BPD {0}".format(i)] = self._calculate_float(config[4*i + 96:4*i + 100])
+        data.update(zip(_BPD_KEYS, _CONFIG_BIN_FLOATS.unpack_from(config, 96)))
 
         # Add the Bin Sample Volume Weight (BSVW) [bytes 160-223]
-        for i in range(0, 16):
-            data["BSVW {0}".format(i)] = self._calculate_float(config[4*i + 160: 4*i + 164])
+        data.update(zip(_BSVW_KEYS, _CONFIG_BIN_FLOATS.unpack_from(config, 160)))
 
         # Add the Gain Scaling Coefficient (GSC) and sample flow rate (SFR)
-        data["GSC"] = self._calculate_float(config[224:228])
-        data["SFR"] = self._calculate_float(config[228:232])
+        data["GSC"] = self._calculate_float(config, 224)
+        data["SFR"] = self._calculate_float(config, 228)
 
         # Add laser dac (LDAC) and Fan dac (FanDAC)
         data["LaserDAC"]    = config[232]
@@ -393,8 +518,6 @@ class OPCN2(_OPC):
         if self.firmware['major'] > 15.:
             data['TOF_SFR'] = config[234]
 
-        sleep(0.1)
-
         return data
 
     @requires_firmware(18.)
@@ -417,27 +540,18 @@ class OPCN2(_OPC):
             'AMLaserOnIdle': 0
         }
         """
-        config  = []
         data    = {}
 
-        # Send the command byte and sleep for 10 ms
-        self.cnxn.xfer([0x3D])
-        sleep(10e-3)
-
-        # Read the config variables by sending 256 empty bytes
-        for i in range(9):
-            resp = self.cnxn.xfer([0x00])[0]
-            config.append(resp)
+        # Send the command byte and read the 9 config bytes
+        config = self._read_n(0x3D, 9)
 
-        data["AMSamplingInterval"]      = self._16bit_unsigned(config[0], config[1])
-        data["AMIdleIntervalCount"]     = self._16bit_unsigned(config[2], config[3])
+        data["AMSamplingInterval"]      = self._16bit_unsigned(config, 0)
+        data["AMIdleIntervalCount"]     = self._16bit_unsigned(config, 2)
         data['AMFanOnIdle']             = config[4]
         data['AMLaserOnIdle']           = config[5]
-        data['AMMaxDataArraysInFile']   = self._16bit_unsigned(config[6], config[7])
+        data['AMMaxDataArraysInFile']   = self._16bit_unsigned(config, 6)
         data['AMOnlySavePMData']        = config[8]
 
-        sleep(0.1)
-
         return data
 
     def write_config_variables(self, config_vars):
@@ -502,81 +616,47 @@ class OPCN2(_OPC):
             'Checksum': 0
         }
         """
-        resp = []
         data = {}
 
-        # Send the command byte
-        self.cnxn.xfer([0x30])
+        # Send the command byte and read the 62 byte histogram
+        resp = self._read_n(0x30, 62)
 
-        # Wait 10 ms
-        sleep(10e-3)
-
-        # read the histogram
-        for i in range(62):
-            r = self.cnxn.xfer([0x00])[0]
-            resp.append(r)
-
-        # convert to real things and store in dictionary!
-        data['Bin 0']           = self._16bit_unsigned(resp[0], resp[1])
-        data['Bin 1']           = self._16bit_unsigned(resp[2], resp[3])
-        data['Bin 2']           = self._16bit_unsigned(resp[4], resp[5])
-        data['Bin 3']           = self._16bit_unsigned(resp[6], resp[7])
-        data['Bin 4']           = self._16bit_unsigned(resp[8], resp[9])
-        data['Bin 5']           = self._16bit_unsigned(resp[10], resp[11])
-        data['Bin 6']           = self._16bit_unsigned(resp[12], resp[13])
-        data['Bin 7']           = self._16bit_unsigned(resp[14], resp[15])
-        data['Bin 8']           = self._16bit_unsigned(resp[16], resp[17])
-        data['Bin 9']           = self._16bit_unsigned(resp[18], resp[19])
-        data['Bin 10']          = self._16bit_unsigned(resp[20], resp[21])
-        data['Bin 11']          = self._16bit_unsigned(resp[22], resp[23])
-        data['Bin 12']          = self._16bit_unsigned(resp[24], resp[25])
-        data['Bin 13']          = self._16bit_unsigned(resp[26], resp[27])
-        data['Bin 14']          = self._16bit_unsigned(resp[28], resp[29])
-        data['Bin 15']          = self._16bit_unsigned(resp[30], resp[31])
-        data['Bin1 MToF']       = self._calculate_mtof(resp[32])
-        data['Bin3 MToF']       = self._calculate_mtof(resp[33])
-        data['Bin5 MToF']       = self._calculate_mtof(resp[34])
-        data['Bin7 MToF']       = self._calculate_mtof(resp[35])
+        # convert to real things and store in dictionary! The whole frame is
+        # decoded in a single call using the layout for this firmware version
 
         # Bins associated with firmware versions 14 and 15(?)
         if self.firmware['version'] < 16.:
-            data['Temperature']     = self._calculate_temp(resp[36:40])
-            data['Pressure']        = self._calculate_pressure(resp[40:44])
-            data['Sampling Period'] = self._calculate_period(resp[44:48])
-            data['Checksum']        = self._16bit_unsigned(resp[48], resp[49])
-            data['PM1']             = self._calculate_float(resp[50:54])
-            data['PM2.5']           = self._calculate_float(resp[54:58])
-            data['PM10']            = self._calculate_float(resp[58:])
+            values = _HISTOGRAM_FRAME_V14.unpack_from(resp, 0)
+
+            data['Temperature']     = self._scale_temp(values[20])
+            data['Pressure']        = values[21]
+            data['Sampling Period'] = self._scale_period(values[22])
 
         else:
-            data['SFR']             = self._calculate_float(resp[36:40])
+            values = _HISTOGRAM_FRAME_V16.unpack_from(resp, 0)
+
+            data['SFR']             = values[20]
 
             # Alright, we don't know whether it is temp or pressure since it switches..
-            tmp = self._calculate_pressure(resp[40:44])
-            if tmp > 98000:
-                data['Temperature'] = None
-                data['Pressure']    = tmp
-            else:
-                tmp = self._calculate_temp(resp[40:44])
-                if tmp < 500:
-                    data['Temperature'] = tmp
-                    data['Pressure']    = None
-                else:
-                    data['Temperature'] = None
-                    data['Pressure']    = None
-
-            data['Sampling Period'] = self._calculate_float(resp[44:48])
-            data['Checksum']        = self._16bit_unsigned(resp[48], resp[49])
-            data['PM1']             = self._calculate_float(resp[50:54])
-            data['PM2.5']           = self._calculate_float(resp[54:58])
-            data['PM10']            = self._calculate_float(resp[58:])
-
-        # Calculate the sum of the histogram bins
-        histogram_sum = data['Bin 0'] + data['Bin 1'] + data['Bin 2']   + \
-                data['Bin 3'] + data['Bin 4'] + data['Bin 5'] + data['Bin 6']   + \
-                data['Bin 7'] + data['Bin 8'] + data['Bin 9'] + data['Bin 10']  + \
-                data['Bin 11'] + data['Bin 12'] + data['Bin 13'] + data['Bin 14'] + \
-                data['Bin 15']
+            # Pressures are above 98000 Pa, temperatures below 500 C (raw value 5000)
+            tmp = values[21]
+            data['Temperature']     = self._scale_temp(tmp) if tmp < 5000 else None
+            data['Pressure']        = tmp if tmp > 98000 else None
+
+            data['Sampling Period'] = values[22]
+
+        bins = values[0:16]
+
+        for key, mtof in zip(_MTOF_KEYS, values[16:20]):
+            data[key] = self._calculate_mtof(mtof)
+
+        data['Checksum']        = values[23]
+        data['PM1']             = values[24]
+        data['PM2.5']           = values[25]
+        data['PM10']            = values[26]
+
+        # Calculate the sum of the raw histogram bins
+        histogram_sum = sum(bins)
 
         # Check that checksum and the least significant bits of the sum of histogram bins
         # are equivilant
@@ -587,25 +667,12 @@ class OPCN2(_OPC):
         # If histogram is true, convert histogram values to number concentration
         if number_concentration is True:
             _conv_ = data['SFR'] * data['Sampling Period'] # Divider in units of ml (cc)
+            _inv_conv_ = 1.0 / _conv_
+
+            bins = [count * _inv_conv_ for count in bins]
 
-            data['Bin 0']   = data['Bin 0'] / _conv_
-            data['Bin 1']   = data['Bin 1'] / _conv_
-            data['Bin 2']   = data['Bin 2'] / _conv_
-            data['Bin 3']   = data['Bin 3'] / _conv_
-            data['Bin 4']   = data['Bin 4'] / _conv_
-            data['Bin 5']   = data['Bin 5'] / _conv_
-            data['Bin 6']   = data['Bin 6'] / _conv_
-            data['Bin 7']   = data['Bin 7'] / _conv_
-            data['Bin 8']   = data['Bin 8'] / _conv_
-            data['Bin 9']   = data['Bin 9'] / _conv_
-            data['Bin 10']  = data['Bin 10'] / _conv_
-            data['Bin 11']  = data['Bin 11'] / _conv_
-            data['Bin 12']  = data['Bin 12'] / _conv_
-            data['Bin 13']  = data['Bin 13'] / _conv_
-            data['Bin 14']  = data['Bin 14'] / _conv_
-            data['Bin 15']  = data['Bin 15'] / _conv_
-
-        sleep(0.1)
+        # Store each bin once, as either a raw count or a number concentration
+        data.update(zip(_BIN_KEYS, bins))
 
         return data
 
@@ -623,23 +690,20 @@ class OPCN2(_OPC):
         command = 0x43
         byte_list = [0x3F, 0x3C, 0x3F, 0x3C, 0x43]
         success = [0xF3, 0x43, 0x3F, 0x3C, 0x3F, 0x3C]
-        resp = []
+
+        self._wait_for_ready()
 
         # Send the command byte and then wait for 10 ms
         r = self.cnxn.xfer([command])[0]
         sleep(10e-3)
 
-        # append the response of the command byte to the List
-        resp.append(r)
-
-        # Send the rest of the config bytes
-        for each in byte_list:
-            r = self.cnxn.xfer([each])[0]
-            resp.append(r)
+        # Send the rest of the config bytes in a single transfer, keeping the
+        # response of the command byte at the front of the List
+        resp = [r] + list(self.cnxn.xfer(byte_list))
 
-        sleep(0.1)
+        self._defer_next_command()
 
-        return True if resp == success else False
+        return resp == success
 
     def _enter_bootloader_mode(self):
         """Enter bootloader mode. Must be issued prior to writing
@@ -652,8 +716,9 @@ class OPCN2(_OPC):
         >>> alpha._enter_bootloader_mode()
         True
         """
+        self._wait_for_ready()
 
-        return True if self.cnxn.xfer(0x41)[0] == 0xF3 else False
+        return self.cnxn.xfer([0x41])[0] == 0xF3
 
     def set_fan_power(self, power):
         """Set only the Fan power.
@@ -673,17 +738,18 @@ class OPCN2(_OPC):
         if power > 255:
             raise ValueError("The fan power should be a single byte (0-255).")
 
+        self._wait_for_ready()
+
         # Send the command byte and wait 10 ms
         a = self.cnxn.xfer([0x42])[0]
         sleep(10e-3)
 
-        # Send the next two bytes
-        b = self.cnxn.xfer([0x00])[0]
-        c = self.cnxn.xfer([power])[0]
+        # Send the next two bytes in a single transfer
+        b, c = self.cnxn.xfer([0x00, power])
 
-        sleep(0.1)
+        self._defer_next_command()
 
-        return True if a == 0xF3 and b == 0x42 and c == 0x00 else False
+        return a == 0xF3 and b == 0x42 and c == 0x00
 
     def set_laser_power(self, power):
         """Set the laser power only.
@@ -704,17 +770,18 @@ class OPCN2(_OPC):
         if power > 255:
             raise ValueError("Laser Power should be a single byte (0-255).")
 
+        self._wait_for_ready()
+
         # Send the command byte and wait 10 ms
         a = self.cnxn.xfer([0x42])[0]
         sleep(10e-3)
 
-        # Send the next two bytes
-        b = self.cnxn.xfer([0x01])[0]
-        c = self.cnxn.xfer([power])[0]
+        # Send the next two bytes in a single transfer
+        b, c = self.cnxn.xfer([0x01, power])
 
-        sleep(0.1)
+        self._defer_next_command()
 
-        return True if a == 0xF3 and b == 0x42 and c == 0x01 else False
+        return a == 0xF3 and b == 0x42 and c == 0x01
 
     def toggle_laser(self, state):
         """Toggle the power state of the laser.
@@ -730,21 +797,8 @@ class OPCN2(_OPC):
         >>> alpha.toggle_laser(True)
         True
         """
-
-        # Send the command byte and wait 10 ms
-        a = self.cnxn.xfer([0x03])[0]
-
-        sleep(10e-3)
-
         # If state is true, turn the laser ON, else OFF
-        if state:
-            b = self.cnxn.xfer([0x02])[0]
-        else:
-            b = self.cnxn.xfer([0x03])[0]
-
-        sleep(0.1)
-
-        return True if a == 0xF3 and b == 0x03 else False
+        return self._power_state_command(0x02 if state else 0x03)
 
     def toggle_fan(self, state):
         """Toggle the power state of the fan.
@@ -760,21 +814,8 @@ class OPCN2(_OPC):
         >>> alpha.toggle_fan(False)
         True
         """
-
-        # Send the command byte and wait 10 ms
-        a = self.cnxn.xfer([0x03])[0]
-
-        sleep(10e-3)
-
         # If state is true, turn the fan ON, else OFF
-        if state:
-            b = self.cnxn.xfer([0x04])[0]
-        else:
-            b = self.cnxn.xfer([0x05])[0]
-
-        sleep(0.1)
-
-        return True if a == 0xF3 and b == 0x03 else False
+        return self._power_state_command(0x04 if state else 0x05)
 
     @requires_firmware(18.)
     def read_pot_status(self):
@@ -794,17 +835,8 @@ class OPCN2(_OPC):
             'LaserON': 0
         }
         """
-        # Send the command byte and wait 10 ms
-        a = self.cnxn.xfer([0x13])[0]
-
-        sleep(10e-3)
-
-        # Build an array of the results
-        res = []
-        for i in range(4):
-            res.append(self.cnxn.xfer([0x00])[0])
-
-        sleep(0.1)
+        # Send the command byte and read the 4 status bytes
+        res = self._read_n(0x13, 4)
 
         return {
             'FanON':        res[0],
@@ -825,20 +857,11 @@ class OPCN2(_OPC):
         >>> alpha.sn()
         'OPC-N2 123456789'
         """
-        string = []
-
-        # Send the command byte and sleep for 9 ms
-        self.cnxn.xfer([0x10])
-        sleep(9e-3)
-
-        # Read the info string by sending 60 empty bytes
-        for i in range(60):
-            resp = self.cnxn.xfer([0x00])[0]
-            string.append(chr(resp))
-
-        sleep(0.1)
+        # Send the command byte and read the 60 byte serial number string
+        resp = self._read_n(0x10, 60, settle=9e-3)
 
-        return ''.join(string)
+        # The serial number is padded out to 60 bytes
+        return resp.decode('latin-1').rstrip('\x00 ')
 
     @requires_firmware(18.)
     def write_sn(self):
@@ -868,18 +891,12 @@ class OPCN2(_OPC):
             'version': 18.2
         }
         """
-        # Send the command byte and sleep for 9 ms
-        self.cnxn.xfer([0x12])
-        sleep(10e-3)
-
-        self.firmware['major'] = self.cnxn.xfer([0x00])[0]
-        self.firmware['minor'] = self.cnxn.xfer([0x00])[0]
+        # Send the command byte and read the major and minor versions
+        self.firmware['major'], self.firmware['minor'] = self._read_n(0x12, 2)
 
         # Build the firmware version
         self.firmware['version'] = float('{}.{}'.format(self.firmware['major'], self.firmware['minor']))
 
-        sleep(0.1)
-
         return self.firmware
 
     @requires_firmware(18.)
@@ -900,26 +917,15 @@ class OPCN2(_OPC):
         }
         """
 
-        resp = []
         data = {}
 
-        # Send the command byte
-        self.cnxn.xfer([0x32])
-
-        # Wait 10 ms
-        sleep(10e-3)
-
-        # read the histogram
-        for i in range(12):
-            r = self.cnxn.xfer([0x00])[0]
-            resp.append(r)
+        # Send the command byte and read the 12 bytes of PM values
+        resp = self._read_n(0x32, 12)
 
         # convert to real things and store in dictionary!
-        data['PM1']     = self._calculate_float(resp[0:4])
-        data['PM2.5']   = self._calculate_float(resp[4:8])
-        data['PM10']    = self._calculate_float(resp[8:])
-
-        sleep(0.1)
+        data['PM1']     = self._calculate_float(resp, 0)
+        data['PM2.5']   = self._calculate_float(resp, 4)
+        data['PM10']    = self._calculate_float(resp, 8)
 
         return data
 
@@ -943,40 +949,37 @@ class OPCN1(_OPC):
 
         :returns: boolean success state
         """
+        self._wait_for_ready()
+
         b1 = self.cnxn.xfer([0x0C])[0]          # send the command byte
         sleep(9e-3)                             # sleep for 9 ms
 
-        return True if b1 == 0xF3 else False
+        return b1 == 0xF3
 
     def off(self):
         """Turn OFF the OPC (fan and laser)
 
         :returns: boolean success state
         """
+        self._wait_for_ready()
+
         b1 = self.cnxn.xfer([0x03])[0]          # send the command byte
         sleep(9e-3)                             # sleep for 9 ms
 
-        return True if b1 == 0xF3 else False
+        return b1 == 0xF3
 
     def read_gsc_sfr(self):
         """Read the gain-scaling-coefficient and sample flow rate.
 
         :returns: dictionary containing GSC and SFR
         """
-        config  = []
         data    = {}
 
-        # Send the command byte and sleep for 10 ms
-        self.cnxn.xfer([0x33])
-        sleep(10e-3)
-
-        # Read the config variables by sending 256 empty bytes
-        for i in range(8):
-            resp = self.cnxn.xfer([0x00])[0]
-            config.append(resp)
+        # Send the command byte and read the GSC and SFR
+        config = self._read_n(0x33, 8)
 
-        data["GSC"] = self._calculate_float(config[0:4])
-        data["SFR"] = self._calculate_float(config[4:])
+        data["GSC"] = self._calculate_float(config, 0)
+        data["SFR"] = self._calculate_float(config, 4)
 
         return data
 
@@ -985,21 +988,13 @@ class OPCN1(_OPC):
 
         :returns: dictionary with 17 bin boundaries.
         """
-        config  = []
         data    = {}
 
-        # Send the command byte and sleep for 10 ms
-        self.cnxn.xfer([0x33])
-        sleep(10e-3)
-
-        # Read the config variables by sending 256 empty bytes
-        for i in range(30):
-            resp = self.cnxn.xfer([0x00])[0]
-            config.append(resp)
+        # Send the command byte and read the bin boundaries
+        config = self._read_n(0x33, 30)
 
-        # Add the bin bounds to the dictionary of data [bytes 0-29]
-        for i in range(0, 14):
-            data["Bin Boundary {0}".format(i)] = self._16bit_unsigned(config[2*i], config[2*i + 1])
+        # Add the bin bounds to the dictionary of data [bytes 0-27]
+        data.update(zip(_BIN_BOUNDARY_KEYS, _N1_BIN_BOUNDARIES.unpack_from(config, 0)))
 
         return data
 
@@ -1015,16 +1010,8 @@ class OPCN1(_OPC):
 
         :returns: float
         """
-        config = []
-
-        # Send the command byte and sleep for 10 ms
-        self.cnxn.xfer([0x33])
-        sleep(10e-3)
-
-        # Read the config variables by sending 256 empty bytes
-        for i in range(4):
-            resp = self.cnxn.xfer([0x00])[0]
-            config.append(resp)
+        # Send the command byte and read the bin particle density
+        config = self._read_n(0x33, 4)
 
         bpd = self._calculate_float(config)
 
@@ -1047,57 +1034,32 @@ class OPCN1(_OPC):
 
         :returns: dictionary
         """
-        resp = []
         data = {}
 
         # command byte
         command = 0x30
 
-        # Send the command byte
-        self.cnxn.xfer([command])
+        # Send the command byte and read the 62 byte histogram
+        buf = self._read_n(command, 62)
 
-        # Wait 10 ms
-        sleep(10e-3)
+        # convert to real things and store in dictionary!
+        bins = _HISTOGRAM_BINS.unpack_from(buf, 0)
 
-        # read the histogram
-        for i in range(62):
-            r = self.cnxn.xfer([0x00])[0]
-            resp.append(r)
+        for key, count in zip(_BIN_KEYS, bins):
+            data[key] = count
 
-        # convert to real things and store in dictionary!
-        data['Bin 0']           = self._16bit_unsigned(resp[0], resp[1])
-        data['Bin 1']           = self._16bit_unsigned(resp[2], resp[3])
-        data['Bin 2']           = self._16bit_unsigned(resp[4], resp[5])
-        data['Bin 3']           = self._16bit_unsigned(resp[6], resp[7])
-        data['Bin 4']           = self._16bit_unsigned(resp[8], resp[9])
-        data['Bin 5']           = self._16bit_unsigned(resp[10], resp[11])
-        data['Bin 6']           = self._16bit_unsigned(resp[12], resp[13])
-        data['Bin 7']           = self._16bit_unsigned(resp[14], resp[15])
-        data['Bin 8']           = self._16bit_unsigned(resp[16], resp[17])
-        data['Bin 9']           = self._16bit_unsigned(resp[18], resp[19])
-        data['Bin 10']          = self._16bit_unsigned(resp[20], resp[21])
-        data['Bin 11']          = self._16bit_unsigned(resp[22], resp[23])
-        data['Bin 12']          = self._16bit_unsigned(resp[24], resp[25])
-        data['Bin 13']          = self._16bit_unsigned(resp[26], resp[27])
-        data['Bin 14']          = self._16bit_unsigned(resp[28], resp[29])
-        data['Bin 15']          = self._16bit_unsigned(resp[30], resp[31])
-        data['Bin1 MToF']       = self._calculate_mtof(resp[32])
-        data['Bin3 MToF']       = self._calculate_mtof(resp[33])
-        data['Bin5 MToF']       = self._calculate_mtof(resp[34])
-        data['Bin7 MToF']       = self._calculate_mtof(resp[35])
-        data['Temperature']     = self._calculate_temp(resp[36:40])
-        data['Pressure']        = self._calculate_pressure(resp[40:44])
-        data['Sampling Period'] = self._calculate_period(resp[44:48])
-        data['Checksum']        = self._16bit_unsigned(resp[48], resp[49])
-        data['PM1']             = self._calculate_float(resp[50:54])
-        data['PM2.5']           = self._calculate_float(resp[54:58])
-        data['PM10']            = self._calculate_float(resp[58:])
-
-        # Calculate the sum of the histogram bins
-        histogram_sum = data['Bin 0'] + data['Bin 1'] + data['Bin 2']   + \
-                data['Bin 3'] + data['Bin 4'] + data['Bin 5'] + data['Bin 6']   + \
-                data['Bin 7'] + data['Bin 8'] + data['Bin 9'] + data['Bin 10']  + \
-                data['Bin 11'] + data['Bin 12'] + data['Bin 13'] + data['Bin 14'] + \
-                data['Bin 15']
+        for key, mtof in zip(_MTOF_KEYS, buf[32:36]):
+            data[key] = self._calculate_mtof(mtof)
+
+        data['Temperature']     = self._calculate_temp(buf, 36)
+        data['Pressure']        = self._calculate_pressure(buf, 40)
+        data['Sampling Period'] = self._calculate_period(buf, 44)
+
+        checksum, pm1, pm25, pm10 = _HISTOGRAM_TAIL.unpack_from(buf, 48)
+
+        data['Checksum']        = checksum
+        data['PM1']             = pm1
+        data['PM2.5']           = pm25
+        data['PM10']            = pm10
 
         return data
@@ -2,12 +2,16 @@ from functools import wraps
 from .exceptions import FirmwareVersionError
 
 def requires_firmware(major):
+    required = float(major)
+
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if float(args[0].firmware['version']) < float(major):
+            version = args[0].firmware['version']
+
+            if version < required:
                 msg = """Your current firmware ({}) does not support this method.
-                    Firmware v{} is required.""".format(args[0].firmware['version'], major)
+                    Firmware v{} is required.""".format(version, major)
 
                 raise FirmwareVersionError(msg)
 
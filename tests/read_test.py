@@ -0,0 +1,41 @@
+import unittest
+from opc import OPCN2
+
+
+class MockSpiDev(object):
+    """Mimics spidev by writing each received byte back into the list passed
+    to xfer and returning that same list.
+    """
+    mode = 1
+
+    def __init__(self):
+        self.sent = []
+
+    def xfer(self, vals):
+        self.sent.append(list(vals))
+
+        for i in range(len(vals)):
+            vals[i] = 0xF3 if len(vals) == 1 else (0x30 + i) & 0xFF
+
+        return vals
+
+
+class ReadTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.spi = MockSpiDev()
+        self.opc = OPCN2(self.spi, firmware=(16, 0))
+
+    def test_padding_stays_zero(self):
+        self.opc.histogram()
+        self.opc.histogram()
+
+        fillers = [vals for vals in self.spi.sent if len(vals) == 62]
+
+        self.assertEqual(len(fillers), 2)
+
+        for vals in fillers:
+            self.assertEqual(vals, [0x00] * 62)
+
+if __name__ == '__main__':
+    unittest.main()